@@ -0,0 +1,241 @@
+import csv
+import hashlib
+import math
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "utils"))
+
+from common_func import (  # noqa: E402
+    HashChangeKind,
+    MemoryUnit,
+    ReplaceInfo,
+    copy_and_replace_file,
+    convert_bytes,
+    convert_data_size,
+    convert_to_bytes,
+    file_to_hash,
+    iter_chunks,
+    iter_lines,
+    make_reader,
+    make_writer,
+    read_csv,
+    read_file,
+    read_json,
+    read_json_stream,
+    read_file_by_extension,
+    text_to_hash,
+    write_csv,
+    write_file_by_extension,
+    write_json,
+)
+
+
+def test_convert_to_bytes_binary_unit():
+    assert convert_to_bytes(1, MemoryUnit.KiB) == 1024
+    assert convert_to_bytes(1, MemoryUnit.MiB) == 1024**2
+    assert convert_to_bytes(1, MemoryUnit.PiB) == 1024**5
+
+
+def test_convert_to_bytes_decimal_unit():
+    assert convert_to_bytes(1, MemoryUnit.B) == 1
+    assert convert_to_bytes(3, MemoryUnit.kB) == 3000
+
+
+def test_convert_bytes_round_trip():
+    for unit in MemoryUnit:
+        assert convert_bytes(convert_to_bytes(5, unit), unit) == 5
+
+
+def test_convert_data_size():
+    assert convert_data_size(1, MemoryUnit.GiB, MemoryUnit.MiB) == 1024
+    assert convert_data_size(1, MemoryUnit.GiB, MemoryUnit.MiB, False) == "1024.00 MiB"
+
+
+def test_read_file_same_result_on_fast_and_buffered_path(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("한글\nline\n", encoding="utf-8")
+    assert read_file(path) == read_file(path, chunk_size=4096) == "한글\nline\n"
+
+    path.write_bytes(b"a\r\nb\rc\n")
+    assert read_file(path) == read_file(path, chunk_size=4096) == "a\nb\nc\n"
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="needs procfs")
+def test_read_file_zero_size_pseudo_file():
+    assert read_file("/proc/self/status").startswith("Name:")
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="needs mkfifo")
+def test_read_file_fifo(tmp_path):
+    path = tmp_path / "fifo"
+    os.mkfifo(path)
+
+    def feed():
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("a\nb\n")
+
+    writer = threading.Thread(target=feed)
+    writer.start()
+    try:
+        assert read_file(path, read_line_by_line=True) == ["a", "b"]
+    finally:
+        writer.join()
+
+
+def test_read_file_line_split_same_on_fast_and_buffered_path(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("a\u2028b\x0cc\n\nd\r\ne", encoding="utf-8", newline="")
+    expected = "a\u2028b\x0cc\n\nd\r\ne".splitlines()
+    assert read_file(path, read_line_by_line=True) == expected
+    assert read_file(path, read_line_by_line=True, chunk_size=4096) == expected
+
+
+def test_copy_and_replace_file_into_directory(tmp_path):
+    src = tmp_path / "src.txt"
+    src.write_bytes(b"hello foo\r\n")
+    dst_dir = tmp_path / "out"
+    dst_dir.mkdir()
+    assert copy_and_replace_file(str(src), str(dst_dir), [ReplaceInfo("foo", "bar")])
+    assert (dst_dir / "src.txt").read_bytes() == b"hello bar\r\n"
+
+
+def test_json_round_trip_keeps_big_int(tmp_path):
+    path = tmp_path / "a.json"
+    data = {"x": 2**70, "y": [1, "a"]}
+    assert write_json(path, data)
+    assert read_json(path) == data
+
+
+def test_json_round_trip_keeps_non_finite_float(tmp_path):
+    path = tmp_path / "a.json"
+    assert write_json(path, {"x": [1.5, {"y": float("inf")}], "z": float("nan")})
+    data = read_json(path)
+    assert data["x"] == [1.5, {"y": float("inf")}]
+    assert math.isnan(data["z"])
+
+
+def test_read_json_accepts_nan(tmp_path):
+    path = tmp_path / "a.json"
+    path.write_text('{"x": NaN}')
+    assert read_json(path)["x"] != read_json(path)["x"]
+
+
+def test_write_csv_accepts_generator(tmp_path, monkeypatch):
+    import common_func
+
+    monkeypatch.setattr(common_func, "_CSV_WRITE_ROWS", 3)
+    path = tmp_path / "a.csv"
+    rows = [[str(i), "a,b"] for i in range(10)]
+    assert write_csv(path, (row for row in rows))
+    with open(path, newline="", encoding="utf-8") as f:
+        assert list(csv.reader(f)) == rows
+
+
+def test_text_to_hash_default_md5():
+    assert text_to_hash("abc") == hashlib.md5(b"abc").hexdigest()
+    assert text_to_hash("abc", HashChangeKind.EXAMPLE) == "ex" + text_to_hash("abc")
+
+
+def test_text_to_hash_blake2b():
+    expected = hashlib.blake2b(b"abc", digest_size=16).hexdigest()
+    assert text_to_hash("abc", algo="blake2b") == expected
+    assert len(expected) == len(text_to_hash("abc"))
+
+
+@pytest.mark.parametrize("use_file_digest", [True, False])
+def test_file_to_hash(tmp_path, monkeypatch, use_file_digest):
+    if not use_file_digest:
+        monkeypatch.delattr(hashlib, "file_digest", raising=False)
+    elif not hasattr(hashlib, "file_digest"):
+        pytest.skip("hashlib.file_digest needs python 3.11+")
+    path = tmp_path / "a.bin"
+    data = os.urandom(300 * 1024)
+    path.write_bytes(data)
+    assert file_to_hash(path) == hashlib.sha256(data).hexdigest()
+    assert file_to_hash(path, "md5") == hashlib.md5(data).hexdigest()
+
+
+@pytest.mark.parametrize("extension", ["json", ".json", "JSON", ".Json"])
+def test_make_reader_writer_normalize_extension(tmp_path, extension):
+    path = tmp_path / "a.json"
+    assert make_writer(extension) is write_json
+    assert make_reader(extension) is read_json
+    assert make_writer(extension)(path, {"a": 1})
+    assert make_reader(extension)(path) == {"a": 1}
+
+
+def test_make_reader_writer_by_type():
+    assert make_reader("txt") is make_reader("log") is make_reader("py") is read_file
+    assert make_reader("csv") is read_csv
+    assert make_writer("csv") is write_csv
+
+
+@pytest.mark.parametrize("extension", ["xml", "", "."])
+def test_make_reader_writer_unsupported(extension):
+    with pytest.raises(Exception, match="Do not support file extension"):
+        make_reader(extension)
+    with pytest.raises(Exception, match="Do not support file extension"):
+        make_writer(extension)
+
+
+def test_read_json_stream(tmp_path):
+    pytest.importorskip("ijson")
+    path = tmp_path / "a.json"
+    path.write_text('[{"a": 1}, {"b": 2}]')
+    assert list(read_json_stream(path)) == [{"a": 1}, {"b": 2}]
+
+
+def test_read_json_stream_without_ijson_raises_on_call(monkeypatch):
+    import common_func
+
+    monkeypatch.setattr(common_func, "ijson", None)
+    with pytest.raises(ImportError):
+        read_json_stream("missing.json")
+
+
+def test_iter_lines_matches_read_file(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_bytes("한글\r\n\nb\x0cc\nd".encode("utf-8"))
+    assert list(iter_lines(path)) == read_file(path, read_line_by_line=True)
+    assert list(iter_lines(path)) == ["한글", "", "b", "c", "d"]
+
+
+def test_iter_chunks(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("한글abcde", encoding="utf-8")
+    assert list(iter_chunks(path, 3)) == ["한글a", "bcd", "e"]
+    assert "".join(iter_chunks(path)) == read_file(path)
+
+
+@pytest.mark.parametrize(
+    "name, data, expected",
+    [
+        ("a.txt", "x\ny\n", "x\ny\n"),
+        ("a.LOG", "x\n", "x\n"),
+        ("a.py", "print(1)\n", "print(1)\n"),
+        ("a.JSON", {"a": [1]}, {"a": [1]}),
+        ("a.csv", [["1", "2"], ["3", "4"]], [[["1", "2"], ["3", "4"]]]),
+    ],
+)
+def test_read_write_file_by_extension(tmp_path, name, data, expected):
+    path = tmp_path / name
+    assert write_file_by_extension(path, data)
+    assert read_file_by_extension(path) == expected
+
+
+def test_read_file_by_extension_line_by_line(tmp_path):
+    path = tmp_path / "a.txt"
+    path.write_text("x\ny\n", encoding="utf-8")
+    assert read_file_by_extension(path, read_line_by_line=True) == ["x", "y"]
+
+
+def test_file_by_extension_unsupported(tmp_path):
+    with pytest.raises(Exception, match="Do not support file extension"):
+        read_file_by_extension(tmp_path / "a.xml")
+    with pytest.raises(Exception, match="Do not support file extension"):
+        write_file_by_extension(tmp_path / "json", {})
@@ -1,19 +1,63 @@
 import requests
+from requests.adapters import HTTPAdapter
 import traceback
 import json
+import math
+import io
 import os
+import stat
 import csv
 import hashlib
 import shutil
+import functools
+import itertools
+import logging
 
 from pathlib import Path
+from http.cookiejar import DefaultCookiePolicy
+from contextlib import contextmanager
 from enum import Enum
-from typing import Union, Tuple, Any, List
+from typing import Union, Tuple, Any, List, Dict, Iterator, IO, Callable, Optional
 from dataclasses import dataclass
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
 
 COMMON_TIMEOUT = 2
 
+# 파일 입출력 시 사용할 buffer 크기 (기본값 8KiB 대비 read/write syscall 횟수 감소)
+_IO_BUF = 128 * 1024
+
+# 이 크기보다 작은 파일은 buffered I/O 없이 os.read 한 번으로 읽음
+_SMALL_FILE_SIZE = 1 << 20
+
+# csv reader가 C 레벨 parsing loop를 큰 buffer 위에서 돌도록 사용할 buffer 크기
+_CSV_BUF = 1 << 20
+
+# write_csv에서 한 번에 직렬화해 파일에 쓰는 row 수 (메모리 사용량 상한)
+_CSV_WRITE_ROWS = 1 << 16
+
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# 이 크기 이상인 파일만 다 읽은 뒤 page cache에서 내림 (작은 파일은 재사용될 가능성이 높음)
+_DONTNEED_SIZE = 64 << 20
+
+# text_to_hash에서 결과를 cache 할 문자열 최대 길이 (큰 문자열이 cache에 남아 메모리를 차지하지 않도록)
+_HASH_CACHE_MAX_LEN = 256
+
+# (protocol, ip, port) 별로 keep-alive 연결을 재사용하기 위한 session 저장소
+_SESSIONS: Dict[Tuple[str, str, int], requests.Session] = {}
+
 
 class RequestMethods(Enum):
     GET = "GET"
@@ -22,14 +66,49 @@ class RequestMethods(Enum):
     PUT = "PUT"
 
 
+# request method 별 (HTTP verb, body를 json으로 보낼지 여부)
+_DISPATCH: Dict[RequestMethods, Tuple[str, bool]] = {
+    RequestMethods.GET: ("GET", False),
+    RequestMethods.POST: ("POST", True),
+    RequestMethods.PUT: ("PUT", True),
+    RequestMethods.DELETE: ("DELETE", True),
+}
+
+
+def _get_session(protocol: str, ip: str, port: int) -> requests.Session:
+    """
+    Description: (protocol, ip, port) 단위로 connection pool을 가진 session을 반환하는 함수
+
+    Args:
+        protocol (str): request protocol
+        ip (str): request ip
+        port (int): request port
+
+    Returns:
+        requests.Session
+    """
+    key = (protocol, ip, port)
+    session = _SESSIONS.get(key)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"Connection": "keep-alive"})
+        # 호출마다 새로 요청하던 기존 동작과 같도록 응답 cookie를 session에 저장하지 않음
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        _SESSIONS[key] = session
+    return session
+
+
 def common_request(
     ip: str,
     port: int,
     path: str = "",
     timeout: int = COMMON_TIMEOUT,
     protocol: str = "http",
-    headers: dict = {},
-    params: dict = {},
+    headers: Optional[dict] = None,
+    params: Optional[dict] = None,
     method: RequestMethods = RequestMethods.GET,
 ) -> Tuple[Any, bool, str]:
     """
@@ -40,52 +119,47 @@ def common_request(
         port (int): request port
         path (str, optional): request path. Defaults to "".
         timeout (int, optional): request timeout. Defaults to COMMON_TIMEOUT.
-        headers (dict, optional): request header. Defaults to {}.
-        params (dict, optional): request parameter. Defaults to {}.
+        headers (dict, optional): request header. Defaults to None.
+        params (dict, optional): request parameter. Defaults to None.
         method (RequestMethods, optional): request method type. Defaults to "RequestMethods.GET".
 
+    Note:
+        request 실패 시 traceback은 logger에 DEBUG 레벨로 기록됨
+
     Returns:
         Tuple[Any, bool, str]: (request 결과 값, request 성공 여부, message)
     """
     res = None
     is_success = False
     message = ""
+    url = "{}://{}:{}/{}".format(protocol, ip, port, path)
     try:
-        url = "{}://{}:{}/{}".format(protocol, ip, port, path)
-        match method:
-            case RequestMethods.GET:
-                result = requests.get(
-                    url, timeout=timeout, headers=headers, params=params
-                )
-            case RequestMethods.POST:
-                result = requests.post(
-                    url, timeout=timeout, headers=headers, json=params
-                )
-            case RequestMethods.DELETE:
-                result = requests.delete(
-                    url, timeout=timeout, headers=headers, json=params
-                )
-            case RequestMethods.PUT:
-                result = requests.put(
-                    url, timeout=timeout, headers=headers, json=params
-                )
-            case _:
-                raise Exception("Do not support request method")
+        entry = _DISPATCH.get(method)
+        if entry is None:
+            raise Exception("Do not support request method")
+        verb, use_json = entry
+        session = _get_session(protocol, ip, port)
+        if use_json:
+            # 기존과 동일하게 params가 없어도 body에 빈 json("{}")을 보냄
+            payload = {"json": params if params is not None else {}}
+        else:
+            payload = {"params": params}
+        result = session.request(verb, url, timeout=timeout, headers=headers, **payload)
         if result.status_code == requests.codes.ok:
             res = result.json()["result"]
             is_success = True
     except requests.exceptions.ConnectionError as rece:
         message = str(rece)
-        traceback.print_exc()
+        logger.debug("request failed : %s", url, exc_info=True)
     except ConnectionRefusedError as cre:
         message = str(cre)
-        traceback.print_exc()
+        logger.debug("request failed : %s", url, exc_info=True)
     except requests.exceptions.ReadTimeout as rert:
         message = str(rert)
-        traceback.print_exc()
+        logger.debug("request failed : %s", url, exc_info=True)
     except Exception as e:
         message = str(e)
-        traceback.print_exc()
+        logger.debug("request failed : %s", url, exc_info=True)
     return (res, is_success, message)
 
 
@@ -103,6 +177,22 @@ class MemoryUnit(Enum):
     PiB = 10
 
 
+# 단위별 byte 환산 계수 (호출 시 거듭제곱 계산 없이 조회만 하도록 명시적으로 정의)
+_TO_BYTES: Dict[MemoryUnit, int] = {
+    MemoryUnit.B: 1,
+    MemoryUnit.kB: 1_000,
+    MemoryUnit.MB: 1_000_000,
+    MemoryUnit.GB: 1_000_000_000,
+    MemoryUnit.TB: 1_000_000_000_000,
+    MemoryUnit.PB: 1_000_000_000_000_000,
+    MemoryUnit.KiB: 1_024,
+    MemoryUnit.MiB: 1_048_576,
+    MemoryUnit.GiB: 1_073_741_824,
+    MemoryUnit.TiB: 1_099_511_627_776,
+    MemoryUnit.PiB: 1_125_899_906_842_624,
+}
+
+
 def convert_bytes(
     size: Union[float, int], target_unit: MemoryUnit, return_num: bool = True
 ) -> Union[float, str]:
@@ -119,10 +209,7 @@ def convert_bytes(
     """
     if not isinstance(size, (float, int)):
         raise ValueError("Size type is not valid")
-    if target_unit.value < 6:
-        size /= 1000**target_unit.value
-    else:
-        size /= 1024 ** (target_unit.value - 5)
+    size /= _TO_BYTES[target_unit]
     if return_num:
         return size
     return f"{size:.2f} {target_unit.name}"
@@ -144,10 +231,7 @@ def convert_to_bytes(
     """
     if not isinstance(size, (float, int)):
         raise ValueError("Size type is not valid")
-    if target_unit.value < 6:
-        size *= 1000**target_unit.value
-    else:
-        size *= 1024 ** (target_unit.value - 6)
+    size *= _TO_BYTES[target_unit]
     if return_num:
         return size
     return f"{size:.2f} {MemoryUnit.B.name}"
@@ -171,8 +255,51 @@ def convert_data_size(
     Returns:
         Union[float, str]: 변환된 데이터 크기
     """
-    size_in_bytes = convert_to_bytes(size, current_unit, True)
-    return convert_bytes(size_in_bytes, convert_unit, return_num)
+    if not isinstance(size, (float, int)):
+        raise ValueError("Size type is not valid")
+    size = size * _TO_BYTES[current_unit] / _TO_BYTES[convert_unit]
+    if return_num:
+        return size
+    return f"{size:.2f} {convert_unit.name}"
+
+
+@contextmanager
+def _open_sequential(
+    file_path: Union[str, Path], mode: str = "r", buffering: int = _IO_BUF, **kwargs
+) -> Iterator[IO]:
+    """
+    Description: 처음부터 끝까지 순차적으로 읽을 파일을 여는 함수
+        kernel에 순차 읽기임을 알려(POSIX_FADV_SEQUENTIAL) readahead를 늘리고,
+        _DONTNEED_SIZE(64MiB) 이상인 파일은 다 읽은 뒤 page cache에서 내리도록(POSIX_FADV_DONTNEED) 알림.
+        posix_fadvise가 없는 OS(Windows 등)나 일반 파일이 아닌 경우(pipe, FIFO 등)에는 일반 open과 동일하게 동작
+
+    Args:
+        file_path (Union[str, Path]): 파일 경로
+        mode (str, optional): 읽기 모드 ("r", "rb"). Defaults to "r".
+        buffering (int, optional): 파일 읽기 buffer 크기. Defaults to _IO_BUF.
+        **kwargs: open에 그대로 전달할 인자 (encoding, newline 등)
+
+    Raises:
+        FileNotFoundError: 해당 파일 경로에 파일이 없을 경우 발생
+
+    Returns:
+        Iterator[IO]
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    drop_cache = False
+    try:
+        # pipe, FIFO 등은 fadvise를 지원하지 않으므로(ESPIPE) 일반 파일일 때만 hint를 줌
+        if _HAS_FADVISE:
+            st = os.fstat(fd)
+            if stat.S_ISREG(st.st_mode):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                drop_cache = st.st_size >= _DONTNEED_SIZE
+        with open(fd, mode, buffering=buffering, closefd=False, **kwargs) as f:
+            yield f
+    finally:
+        if drop_cache:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        os.close(fd)
 
 
 class ExtensionType(Enum):
@@ -189,7 +316,8 @@ def read_json(file_path: Union[str, Path], chunk_size: int = 0) -> Union[list, d
 
     Args:
         file_path (Union[str, Path]): 파일 경로
-        chunk_size (int, optional): 파일이 클 경우 chunk 단위로 나눠 읽어오기위한 파라미터. Defaults to 0.
+        chunk_size (int, optional): 파일 읽기 buffer 크기. 0이면 _IO_BUF 사용.
+            큰 파일을 나눠 읽어야 할 경우 read_json_stream 사용. Defaults to 0.
 
     Raises:
         FileNotFoundError: 해당 파일 경로에 파일이 없을 경우 발생
@@ -199,16 +327,66 @@ def read_json(file_path: Union[str, Path], chunk_size: int = 0) -> Union[list, d
         Union[list, dict]
     """
     try:
-        with open(file_path, "r") as f:
-            if chunk_size == 0:
-                return json.load(f)
-            return json.load("".join(iter(lambda: f.read(chunk_size), "")))
+        with _open_sequential(file_path, "r", chunk_size or _IO_BUF) as f:
+            return json.load(f)
     except FileNotFoundError as e:
         raise Exception(f"file not found error : {str(e)}")
     except json.JSONDecodeError as e:
         raise Exception(f"json decode error : {str(e)}")
 
 
+def read_json_stream(
+    file_path: Union[str, Path], prefix: str = "item"
+) -> Iterator[Any]:
+    """
+    Description: 큰 Json 파일을 전체 로드하지 않고 prefix에 해당하는 객체를 하나씩 읽어오기 위한 함수 (ijson 필요)
+
+    Args:
+        file_path (Union[str, Path]): 파일 경로
+        prefix (str, optional): 읽어올 객체의 ijson prefix. 최상위 list의 원소는 "item". Defaults to "item".
+
+    Raises:
+        FileNotFoundError: 해당 파일 경로에 파일이 없을 경우 발생
+        ImportError: ijson이 설치되어 있지 않을 경우 발생
+
+    Returns:
+        Iterator[Any]
+    """
+    if ijson is None:
+        raise ImportError("read_json_stream requires ijson (pip install ijson)")
+    return _iter_json_items(file_path, prefix)
+
+
+def _iter_json_items(file_path: Union[str, Path], prefix: str) -> Iterator[Any]:
+    try:
+        with _open_sequential(file_path, "rb") as f:
+            yield from ijson.items(f, prefix)
+    except FileNotFoundError as e:
+        raise Exception(f"file not found error : {str(e)}")
+
+
+def _read_small_file(file_path: Union[str, Path], size: int) -> bytes:
+    """
+    Description: 작은 파일을 buffered I/O 없이 os.read로 읽어오는 함수
+        stat 이후 파일이 커졌을 수 있으므로 os.read가 b""를 반환할 때까지 읽음
+
+    Args:
+        file_path (Union[str, Path]): 파일 경로
+        size (int): stat으로 확인한 파일 크기
+
+    Returns:
+        bytes
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        chunks = [os.read(fd, size)]
+        while chunk := os.read(fd, _IO_BUF):
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
 def read_file(
     file_path: Union[str, Path], read_line_by_line: bool = False, chunk_size: int = 0
 ) -> Union[List[str], str]:
@@ -218,7 +396,13 @@ def read_file(
     Args:
         file_path (Union[str, Path]): 파일 경로
         read_line_by_line (bool, optional): 한줄 씩 읽어서 list에 담을 것인지 정하기 위한 트리거 파라미터. Defaults to False.
-        chunk_size (int, optional): 파일이 클 경우 chunk 단위로 나눠 읽어오기위한 파라미터. Defaults to 0.
+        chunk_size (int, optional): 파일 읽기 buffer 크기. 0이면 _IO_BUF 사용.
+            파일을 chunk 단위로 나눠 처리해야 할 경우 iter_chunks 사용. Defaults to 0.
+
+    Note:
+        파일 크기, chunk_size와 관계없이 utf-8로 decode 하고 개행 문자(\r\n, \r)는 \n으로 변환함.
+        chunk_size가 0이고 파일 크기가 _SMALL_FILE_SIZE(1MiB) 미만이면 os.read로 바로 읽음.
+        크기가 0으로 보고되는 파일(/proc 등)은 buffered 방식으로 읽음
 
     Raises:
         FileNotFoundError: 해당 파일 경로에 파일이 없을 경우 발생
@@ -227,14 +411,69 @@ def read_file(
         Union[List[str], str]
     """
     try:
-        with open(file_path, "r") as f:
+        if chunk_size == 0:
+            size = os.stat(file_path).st_size
+            if 0 < size < _SMALL_FILE_SIZE:
+                data = _read_small_file(file_path, size).decode("utf-8")
+                if read_line_by_line:
+                    return data.splitlines()
+                # buffered 방식(universal newline)과 같은 결과가 되도록 개행 문자 변환
+                if "\r" in data:
+                    data = data.replace("\r\n", "\n").replace("\r", "\n")
+                return data
+        with _open_sequential(
+            file_path, "r", chunk_size or _IO_BUF, encoding="utf-8"
+        ) as f:
             if read_line_by_line:
-                if chunk_size == 0:
-                    return f.read().splitlines()
-                return "".join(iter(lambda: f.read(chunk_size), "")).splitlines()
-            if chunk_size == 0:
-                return f.read()
-            return "".join(iter(lambda: f.read(chunk_size), ""))
+                # 작은 파일의 str.splitlines()와 같은 기준(\x0c, \u2028 등 포함)으로 분리
+                lines: List[str] = []
+                for line in f:
+                    lines.extend(line.splitlines() or [""])
+                return lines
+            return f.read()
+    except FileNotFoundError as e:
+        raise Exception(f"file not found error : {str(e)}")
+
+
+def iter_lines(file_path: Union[str, Path]) -> Iterator[str]:
+    """
+    Description: 파일 전체를 list로 만들지 않고 한줄 씩 읽어오기 위한 함수
+
+    Args:
+        file_path (Union[str, Path]): 파일 경로
+
+    Raises:
+        FileNotFoundError: 해당 파일 경로에 파일이 없을 경우 발생
+
+    Returns:
+        Iterator[str]: 개행 문자가 제거된 한 줄
+    """
+    try:
+        with _open_sequential(file_path, "r", encoding="utf-8") as f:
+            for line in f:
+                yield from line.splitlines() or [""]
+    except FileNotFoundError as e:
+        raise Exception(f"file not found error : {str(e)}")
+
+
+def iter_chunks(file_path: Union[str, Path], size: int = _IO_BUF) -> Iterator[str]:
+    """
+    Description: 큰 파일을 전체 로드하지 않고 chunk 단위로 나눠 읽어오기 위한 함수
+
+    Args:
+        file_path (Union[str, Path]): 파일 경로
+        size (int, optional): 한 번에 읽어올 문자 수. Defaults to _IO_BUF.
+
+    Raises:
+        FileNotFoundError: 해당 파일 경로에 파일이 없을 경우 발생
+
+    Returns:
+        Iterator[str]
+    """
+    try:
+        with _open_sequential(file_path, "r", encoding="utf-8") as f:
+            while chunk := f.read(size):
+                yield chunk
     except FileNotFoundError as e:
         raise Exception(f"file not found error : {str(e)}")
 
@@ -256,28 +495,54 @@ def read_csv(
     Returns:
         list:
     """
-    data: List[list] = []
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
+        with _open_sequential(
+            file_path, "r", _CSV_BUF, encoding="utf-8", newline=""
+        ) as f:
             reader = csv.reader(f)
             if has_header:
                 header = next(reader)
-            for i, row in enumerate(reader):
-                if i % chunk_size == 0:
-                    data.append([])
-                data[-1].append(row)
+            rows = list(reader)
+        data: List[list] = [
+            rows[i : i + chunk_size] for i in range(0, len(rows), chunk_size)
+        ]
         if has_header:
-            data.insert(0, header)
+            return [header] + data
         return data
     except FileNotFoundError as e:
         raise Exception(f"file not found error : {str(e)}")
 
 
+def _has_non_finite_float(data: Any) -> bool:
+    """
+    Description: dict, list, tuple 안에 NaN, Infinity 값이 있는지 확인하는 함수
+
+    Args:
+        data (Any): 확인할 데이터
+
+    Returns:
+        bool: NaN, Infinity 값이 있으면 True
+    """
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, float):
+            if not math.isfinite(obj):
+                return True
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+    return False
+
+
 def write_json(
     file_path: Union[str, Path], data: Union[dict, List[dict]], mode: str = "w"
 ) -> bool:
     """
     Description: json 파일의 내용을 쓰기위한 함수
+        orjson이 설치되어 있으면 orjson으로 직렬화하며, orjson이 그대로 저장하지 못하는 값
+        (64bit 범위를 넘는 정수, NaN, Infinity)이 있으면 json 모듈로 저장함
 
     Args:
         file_path (Union[str, Path]): 파일 경로
@@ -292,7 +557,18 @@ def write_json(
     """
     mode = "w" if mode not in ["a", "w"] else mode
     try:
-        with open(file_path, mode) as f:
+        # orjson은 NaN, Infinity를 null로 바꿔 저장하므로 json 모듈을 사용
+        if orjson is not None and not _has_non_finite_float(data):
+            # 파일을 열기 전에 직렬화하여 실패 시 기존 파일 내용이 지워지지 않도록 함
+            try:
+                encoded = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                encoded = None
+            if encoded is not None:
+                with open(file_path, mode + "b", buffering=_IO_BUF) as f:
+                    f.write(encoded)
+                return True
+        with open(file_path, mode, buffering=_IO_BUF) as f:
             json.dump(data, f)
         return True
     except FileNotFoundError as e:
@@ -323,7 +599,7 @@ def write_file(file_path: Union[str, Path], data: str, mode: str = "w") -> bool:
         data = str(data)
     mode = "w" if mode not in ["a", "w"] else mode
     try:
-        with open(file_path, mode, encoding="utf-8") as f:
+        with open(file_path, mode, buffering=_IO_BUF, encoding="utf-8") as f:
             f.write(data)
         return True
     except FileNotFoundError as e:
@@ -351,8 +627,18 @@ def write_csv(
     """
     mode = mode if mode in ["a", "w"] else "w"
     try:
-        with open(file_path, mode, encoding="utf-8", newline="") as f:
-            csv.writer(f).writerows(data)
+        # row 마다 파일에 쓰지 않도록 StringIO에 모아서 block 단위로 한 번에 씀
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        with open(
+            file_path, mode, buffering=_CSV_BUF, encoding="utf-8", newline=""
+        ) as f:
+            rows = iter(data)
+            while block := list(itertools.islice(rows, _CSV_WRITE_ROWS)):
+                writer.writerows(block)
+                f.write(buf.getvalue())
+                buf.seek(0)
+                buf.truncate()
         return True
     except FileNotFoundError as e:
         return False
@@ -373,12 +659,29 @@ def get_extension(file_path: Union[str, Path]) -> str:
     return os.path.splitext(file_path)[1]
 
 
+# 확장자(소문자) 별 파일 읽기/쓰기 함수
+_READERS: Dict[str, Callable[..., Any]] = {
+    ExtensionType.TXT.value: read_file,
+    ExtensionType.LOG.value: read_file,
+    ExtensionType.PY.value: read_file,
+    ExtensionType.JSON.value: read_json,
+    ExtensionType.CSV.value: read_csv,
+}
+_WRITERS: Dict[str, Callable[..., bool]] = {
+    ExtensionType.TXT.value: write_file,
+    ExtensionType.LOG.value: write_file,
+    ExtensionType.PY.value: write_file,
+    ExtensionType.JSON.value: write_json,
+    ExtensionType.CSV.value: write_csv,
+}
+
+
 # 파일 확장자에 따라 적절한 함수를 호출하여 파일을 읽어오는 함수
 def read_file_by_extension(
     file_path: Union[str, Path], read_line_by_line: bool = False
 ) -> Union[List[str], str, dict]:
     """
-    Description: 파일 확장자에 따라 파일 읽기를 지원하는 함수
+    Description: 파일 확장자에 따라 파일 읽기를 지원하는 함수 (확장자 대소문자 구분 없음)
 
     Args:
         file_path (str): 파일 경로
@@ -391,20 +694,12 @@ def read_file_by_extension(
     Returns:
         Union[List[str], str, dict]:
     """
-    extension = get_extension(file_path=file_path)
-    match extension:
-        case ExtensionType.TXT:
-            return read_file(file_path=file_path, read_line_by_line=read_line_by_line)
-        case ExtensionType.CSV:
-            return read_csv(file_path=file_path)
-        case ExtensionType.JSON:
-            return read_json(file_path=file_path)
-        case ExtensionType.LOG:
-            return read_file(file_path=file_path, read_line_by_line=read_line_by_line)
-        case ExtensionType.PY:
-            return read_file(file_path=file_path, read_line_by_line=read_line_by_line)
-        case _:
-            raise Exception
+    reader = _READERS.get(get_extension(file_path=file_path).lower())
+    if reader is None:
+        raise Exception(f"Do not support file extension : {file_path}")
+    if reader is read_file:
+        return reader(file_path=file_path, read_line_by_line=read_line_by_line)
+    return reader(file_path=file_path)
 
 
 # 파일 확장자에 따라 적절한 함수를 호출하여 파일에 내용을 쓰는 함수
@@ -412,7 +707,7 @@ def write_file_by_extension(
     file_path: Union[str, Path], data: Any, mode: str = "w"
 ) -> bool:
     """
-    Description: 파일 확장자와 mode에 따라 파일 쓰기를 지원하는 함수
+    Description: 파일 확장자와 mode에 따라 파일 쓰기를 지원하는 함수 (확장자 대소문자 구분 없음)
 
     Args:
         file_path (str): 파일 경로
@@ -425,20 +720,53 @@ def write_file_by_extension(
     Returns:
         bool: 쓰기 성공하면 True, 실패하면 False
     """
-    extension = get_extension(file_path=file_path)
-    match extension:
-        case ExtensionType.TXT:
-            return write_file(file_path=file_path, data=data, mode=mode)
-        case ExtensionType.CSV:
-            return write_csv(file_path=file_path, data=data, mode=mode)
-        case ExtensionType.JSON:
-            return write_json(file_path=file_path, data=data, mode=mode)
-        case ExtensionType.LOG:
-            return write_file(file_path=file_path, data=data, mode=mode)
-        case ExtensionType.PY:
-            return write_file(file_path=file_path, data=data, mode=mode)
-        case _:
-            raise Exception
+    writer = _WRITERS.get(get_extension(file_path=file_path).lower())
+    if writer is None:
+        raise Exception(f"Do not support file extension : {file_path}")
+    return writer(file_path=file_path, data=data, mode=mode)
+
+
+def make_reader(extension: str) -> Callable[..., Any]:
+    """
+    Description: 확장자에 맞는 파일 읽기 함수를 반환하는 함수
+        같은 확장자의 파일을 반복해서 읽을 때 매 호출마다 확장자를 판별하지 않도록 미리 함수를 받아 사용
+        ex) reader = make_reader("json"); for path in paths: reader(path)
+
+    Args:
+        extension (str): 파일 확장자 ("json", ".json", "JSON" 모두 가능)
+
+    Raises:
+        Exception: 현재 지원하지 않는 유형의 데이터일 경우
+                    지원하는 데이터 유형 : txt, log, json, py, csv
+
+    Returns:
+        Callable[..., Any]: read_file, read_json, read_csv 중 하나
+    """
+    reader = _READERS.get("." + extension.lstrip(".").lower())
+    if reader is None:
+        raise Exception(f"Do not support file extension : {extension}")
+    return reader
+
+
+def make_writer(extension: str) -> Callable[..., bool]:
+    """
+    Description: 확장자에 맞는 파일 쓰기 함수를 반환하는 함수
+        ex) writer = make_writer("csv"); for path, data in items: writer(path, data)
+
+    Args:
+        extension (str): 파일 확장자 ("csv", ".csv", "CSV" 모두 가능)
+
+    Raises:
+        Exception: 현재 지원하지 않는 유형의 데이터일 경우
+                    지원하는 데이터 유형 : txt, log, json, py, csv
+
+    Returns:
+        Callable[..., bool]: write_file, write_json, write_csv 중 하나
+    """
+    writer = _WRITERS.get("." + extension.lstrip(".").lower())
+    if writer is None:
+        raise Exception(f"Do not support file extension : {extension}")
+    return writer
 
 
 # hash 변환할 목록 정리
@@ -447,25 +775,71 @@ class HashChangeKind(Enum):
     EXAMPLE = "example"
 
 
-def text_to_hash(text: str, kind: HashChangeKind = HashChangeKind.GENERAL) -> str:
+def _text_to_hash(text: str, kind: HashChangeKind, algo: str) -> str:
+    if algo == "blake2b":
+        hash_ = hashlib.blake2b(text.encode(), digest_size=16)
+    else:
+        hash_ = hashlib.new(algo, text.encode())
+    match kind:
+        case HashChangeKind.GENERAL:
+            return hash_.hexdigest()
+        case HashChangeKind.EXAMPLE:
+            return "ex" + hash_.hexdigest()
+        case _:
+            raise ValueError
+
+
+_cached_text_to_hash = functools.lru_cache(maxsize=1 << 16)(_text_to_hash)
+
+
+def text_to_hash(
+    text: str, kind: HashChangeKind = HashChangeKind.GENERAL, algo: str = "md5"
+) -> str:
     """
-    Description: 이 함수는 입력된 문자열을 MD5 해시로 변환하여 반환합니다.
+    Description: 이 함수는 입력된 문자열을 해시로 변환하여 반환합니다.
 
     Args:
         text (str): 해시로 변환할 문자열입니다.
         kind (HashChangeKind, optional): 해시 변환 종류입니다. Defaults to HashChangeKind.GENERAL.
+        algo (str, optional): 해시 알고리즘입니다. 기존 결과값 호환을 위해 기본값은 md5이며,
+            "blake2b"를 지정하면 md5와 같은 길이(16byte)의 더 빠르고 안전한 해시를 사용합니다. Defaults to "md5".
+
+    Note:
+        _HASH_CACHE_MAX_LEN 이하 길이의 문자열만 결과를 cache 합니다.
 
     Returns:
         str: 변환된 해시 문자열입니다.
     """
-    hash_ = hashlib.md5(text.encode())
-    match kind:
-        case HashChangeKind.GENERAL:
+    if len(text) <= _HASH_CACHE_MAX_LEN:
+        return _cached_text_to_hash(text, kind, algo)
+    return _text_to_hash(text, kind, algo)
+
+
+def file_to_hash(file_path: Union[str, Path], algo: str = "sha256") -> str:
+    """
+    Description: 파일 내용을 전체 로드하지 않고 block 단위로 읽어 해시로 변환하여 반환합니다.
+
+    Args:
+        file_path (Union[str, Path]): 파일 경로
+        algo (str, optional): 해시 알고리즘입니다. Defaults to "sha256".
+
+    Raises:
+        FileNotFoundError: 해당 파일 경로에 파일이 없을 경우 발생
+
+    Returns:
+        str: 변환된 해시 문자열입니다.
+    """
+    try:
+        with _open_sequential(file_path, "rb") as f:
+            # python 3.11 이상은 C 레벨에서 block 단위로 읽어 해시 계산
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, algo).hexdigest()
+            hash_ = hashlib.new(algo)
+            while chunk := f.read(_IO_BUF):
+                hash_.update(chunk)
             return hash_.hexdigest()
-        case HashChangeKind.EXAMPLE:
-            return "ex" + hash_.hexdigest()
-        case _:
-            raise ValueError
+    except FileNotFoundError as e:
+        raise Exception(f"file not found error : {str(e)}")
 
 
 def create_folder(path: str) -> bool:
@@ -476,18 +850,17 @@ def create_folder(path: str) -> bool:
         path (str): 새로운 파일을 생성할 경로.
 
     Returns:
-        bool
+        bool: 새로 생성하면 True, 이미 존재하면 False
     """
     try:
-        if not os.path.exists(path):
-            os.makedirs(path)
-            print(f"Folder '{path}' created successfully!")
-            return True
-        else:
-            print(f"Folder '{path}' already exists.")
-            return False
+        os.makedirs(path)
+        logger.debug("Folder '%s' created successfully!", path)
+        return True
+    except FileExistsError:
+        logger.debug("Folder '%s' already exists.", path)
+        return False
     except OSError as e:
-        print(f"Error: Failed to create folder '{path}'.")
+        logger.error("Error: Failed to create folder '%s'.", path)
         raise e
 
 
@@ -501,34 +874,49 @@ class ReplaceInfo:
 # exception 처리는 사용하는 방식에 따라 변경 가능
 # 현재는 동일한 파일이 있을 경우 error 처리
 def copy_and_replace_file(
-    original_file_path: str, copy_file_path: str, replace_list: List[ReplaceInfo] = None
+    original_file_path: str,
+    copy_file_path: str,
+    replace_list: List[ReplaceInfo] = None,
+    preserve_metadata: bool = False,
 ) -> bool:
     """
     Description : 파일 복사 시 사용되는 함수로 만약 replace 할 문자열이 있다면 ReplaceInfo class 사용할 것
 
     Args:
         original_file_path (str) : 복사할 파일의 원래 경로
-        copy_file_path (str) : 복사될 파일의 경로
+        copy_file_path (str) : 복사될 파일의 경로 (폴더이면 원본 파일 이름으로 그 안에 복사)
         replace_list (list in ReplaceInfo)
+        preserve_metadata (bool, optional): 파일 권한 등 metadata까지 복사할지 여부. Defaults to False.
 
     Returns:
         bool
     """
     try:
-        shutil.copy(original_file_path, copy_file_path)
+        # 대상이 폴더이면 원본 파일 이름으로 그 안에 복사 (shutil.copy와 동일)
+        if os.path.isdir(copy_file_path):
+            copy_file_path = os.path.join(
+                copy_file_path, os.path.basename(original_file_path)
+            )
+        if preserve_metadata:
+            shutil.copy(original_file_path, copy_file_path)
+        else:
+            shutil.copyfile(original_file_path, copy_file_path)
 
         if replace_list:
-            # 파일 읽기
-            with open(copy_file_path, "r", encoding="utf-8") as file:
+            with open(copy_file_path, "r+b", buffering=_IO_BUF) as file:
+                # 파일 읽기 (decode 없이 bytes 그대로)
                 file_data = file.read()
 
-            # 문자열 변경
-            for replace in replace_list:
-                file_data = file_data.replace(replace.old_str, replace.new_str)
+                # 문자열 변경
+                for replace in replace_list:
+                    file_data = file_data.replace(
+                        replace.old_str.encode("utf-8"), replace.new_str.encode("utf-8")
+                    )
 
-            # 수정된 내용 저장
-            with open(copy_file_path, "w", encoding="utf-8") as file:
+                # 수정된 내용 저장
+                file.seek(0)
                 file.write(file_data)
+                file.truncate()
 
         return True
 